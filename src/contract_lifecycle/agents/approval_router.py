@@ -7,6 +7,8 @@ from auto-approval through CFO-level review.
 
 from __future__ import annotations
 
+import bisect
+
 import structlog
 
 from contract_lifecycle.models import (
@@ -48,6 +50,9 @@ _VALUE_THRESHOLDS = {
     "cfo": 1_000_000,
 }
 
+# Ascending tier boundaries derived from the value thresholds above
+_TIER_BOUNDARIES: tuple[int, ...] = tuple(sorted(_VALUE_THRESHOLDS.values()))
+
 # Default approver names by level
 _DEFAULT_APPROVERS: dict[ApprovalLevel, str] = {
     ApprovalLevel.AUTO: "System (Auto-Approval)",
@@ -58,6 +63,73 @@ _DEFAULT_APPROVERS: dict[ApprovalLevel, str] = {
 }
 
 
+def value_tier(contract_value: float) -> int:
+    """Return the value tier of a contract for approval routing.
+
+    The tier is the number of value thresholds the contract meets
+    (0 = below $50K, 4 = $1M and above). Contracts in the same tier
+    are routed identically.
+    """
+    return bisect.bisect_right(_TIER_BOUNDARIES, contract_value)
+
+
+# Approval levels in ascending seniority (the order of every chain)
+_SENIORITY: tuple[ApprovalLevel, ...] = (
+    ApprovalLevel.AUTO,
+    ApprovalLevel.MANAGER,
+    ApprovalLevel.VP,
+    ApprovalLevel.LEGAL,
+    ApprovalLevel.CFO,
+)
+
+# Levels required by the overall risk level
+_RISK_LEVELS: dict[RiskLevel, tuple[ApprovalLevel, ...]] = {
+    RiskLevel.LOW: (ApprovalLevel.AUTO,),
+    RiskLevel.MEDIUM: (ApprovalLevel.MANAGER,),
+    RiskLevel.HIGH: (ApprovalLevel.MANAGER, ApprovalLevel.VP, ApprovalLevel.LEGAL),
+    RiskLevel.CRITICAL: (
+        ApprovalLevel.MANAGER,
+        ApprovalLevel.VP,
+        ApprovalLevel.LEGAL,
+        ApprovalLevel.CFO,
+    ),
+}
+
+# Levels added by contract value, indexed by value tier
+_TIER_LEVELS: tuple[tuple[ApprovalLevel, ...], ...] = (
+    (),
+    (ApprovalLevel.MANAGER,),
+    (ApprovalLevel.MANAGER, ApprovalLevel.VP),
+    (ApprovalLevel.MANAGER, ApprovalLevel.VP, ApprovalLevel.LEGAL),
+    (ApprovalLevel.MANAGER, ApprovalLevel.VP, ApprovalLevel.LEGAL, ApprovalLevel.CFO),
+)
+
+# Contract types that always require legal review
+_LEGAL_REVIEW_TYPES = frozenset({ContractType.EMPLOYMENT, ContractType.LICENSING})
+
+
+def _route(
+    risk: RiskLevel, tier: int, contract_type: ContractType
+) -> tuple[ApprovalLevel, ...]:
+    """Combine the risk, value, and type rules into one approval chain."""
+    levels = {*_RISK_LEVELS[risk], *_TIER_LEVELS[tier]}
+    if contract_type in _LEGAL_REVIEW_TYPES:
+        levels.add(ApprovalLevel.LEGAL)
+    # AUTO only stands alone; any human approval replaces it
+    if len(levels) > 1:
+        levels.discard(ApprovalLevel.AUTO)
+    return tuple(level for level in _SENIORITY if level in levels)
+
+
+# Every possible chain, keyed by (risk level, value tier, contract type)
+_APPROVAL_TABLE: dict[tuple[RiskLevel, int, ContractType], tuple[ApprovalLevel, ...]] = {
+    (risk, tier, contract_type): _route(risk, tier, contract_type)
+    for risk in RiskLevel
+    for tier in range(len(_TIER_LEVELS))
+    for contract_type in ContractType
+}
+
+
 class ApprovalRouterAgent:
     """Approval Workflow Manager agent.
 
@@ -92,6 +164,9 @@ class ApprovalRouterAgent:
         - HIGH risk or value $250K-$1M -> MANAGER + VP + LEGAL
         - CRITICAL risk or value > $1M -> MANAGER + VP + LEGAL + CFO
 
+        Every combination is precomputed in ``_APPROVAL_TABLE``, so routing
+        is a single lookup keyed by risk, value tier, and contract type.
+
         Args:
             overall_risk: The aggregate risk level from risk assessment.
             contract_value: The total monetary value of the contract.
@@ -108,62 +183,9 @@ class ApprovalRouterAgent:
             contract_type=contract_type.value,
         )
 
-        chain: list[ApprovalLevel] = []
-
-        # Risk-based routing
-        if overall_risk == RiskLevel.LOW:
-            chain = [ApprovalLevel.AUTO]
-        elif overall_risk == RiskLevel.MEDIUM:
-            chain = [ApprovalLevel.MANAGER]
-        elif overall_risk == RiskLevel.HIGH:
-            chain = [ApprovalLevel.MANAGER, ApprovalLevel.VP, ApprovalLevel.LEGAL]
-        elif overall_risk == RiskLevel.CRITICAL:
-            chain = [
-                ApprovalLevel.MANAGER,
-                ApprovalLevel.VP,
-                ApprovalLevel.LEGAL,
-                ApprovalLevel.CFO,
-            ]
-
-        # Value-based escalation (add levels not already in chain)
-        if contract_value >= _VALUE_THRESHOLDS["cfo"]:
-            for level in [ApprovalLevel.MANAGER, ApprovalLevel.VP,
-                          ApprovalLevel.LEGAL, ApprovalLevel.CFO]:
-                if level not in chain:
-                    chain.append(level)
-        elif contract_value >= _VALUE_THRESHOLDS["legal"]:
-            for level in [ApprovalLevel.MANAGER, ApprovalLevel.VP, ApprovalLevel.LEGAL]:
-                if level not in chain:
-                    chain.append(level)
-        elif contract_value >= _VALUE_THRESHOLDS["vp"]:
-            for level in [ApprovalLevel.MANAGER, ApprovalLevel.VP]:
-                if level not in chain:
-                    chain.append(level)
-        elif contract_value >= _VALUE_THRESHOLDS["manager"]:
-            if ApprovalLevel.MANAGER not in chain:
-                chain.append(ApprovalLevel.MANAGER)
-
-        # Contract type overrides
-        if contract_type == ContractType.EMPLOYMENT:
-            if ApprovalLevel.LEGAL not in chain:
-                chain.append(ApprovalLevel.LEGAL)
-        elif contract_type == ContractType.LICENSING:
-            if ApprovalLevel.LEGAL not in chain:
-                chain.append(ApprovalLevel.LEGAL)
-
-        # Remove AUTO if any human approval is needed
-        if len(chain) > 1 and ApprovalLevel.AUTO in chain:
-            chain.remove(ApprovalLevel.AUTO)
-
-        # Sort by seniority
-        seniority_order = [
-            ApprovalLevel.AUTO,
-            ApprovalLevel.MANAGER,
-            ApprovalLevel.VP,
-            ApprovalLevel.LEGAL,
-            ApprovalLevel.CFO,
-        ]
-        chain.sort(key=lambda level: seniority_order.index(level))
+        chain = list(
+            _APPROVAL_TABLE[(overall_risk, value_tier(contract_value), contract_type)]
+        )
 
         logger.info(
             "approval_chain_determined",
@@ -43,7 +43,7 @@ BACKSTORY = (
 # Compliance check definitions
 # ---------------------------------------------------------------------------
 
-_GDPR_REQUIREMENTS = [
+_GDPR_REQUIREMENTS: tuple[tuple[str, re.Pattern[str]], ...] = (
     ("data_processing_basis", re.compile(
         r"lawful\s+basis|legitimate\s+interest|consent|contract\s+necessity",
         re.IGNORECASE,
@@ -64,9 +64,9 @@ _GDPR_REQUIREMENTS = [
         r"(?:standard\s+contractual|adequacy\s+decision|binding\s+corporate|data\s+transfer)",
         re.IGNORECASE,
     )),
-]
+)
 
-_SOX_REQUIREMENTS = [
+_SOX_REQUIREMENTS: tuple[tuple[str, re.Pattern[str]], ...] = (
     ("financial_controls", re.compile(
         r"internal\s+control|financial\s+reporting|audit\s+trail",
         re.IGNORECASE,
@@ -79,9 +79,9 @@ _SOX_REQUIREMENTS = [
         r"segregation\s+of\s+duties|separation\s+of\s+duties",
         re.IGNORECASE,
     )),
-]
+)
 
-_GENERAL_COMPLIANCE = [
+_GENERAL_COMPLIANCE: tuple[tuple[str, re.Pattern[str]], ...] = (
     ("governing_law", re.compile(
         r"governing\s+law|applicable\s+law|jurisdiction",
         re.IGNORECASE,
@@ -102,7 +102,7 @@ _GENERAL_COMPLIANCE = [
         r"entire\s+agreement|whole\s+agreement|integration\s+clause",
         re.IGNORECASE,
     )),
-]
+)
 
 
 class ComplianceOfficerAgent:
@@ -17,6 +17,7 @@ from contract_lifecycle.models import (
     ContractAnalysis,
     ContractType,
 )
+from contract_lifecycle.tools._regex_cache import ascii_flag, compiled
 from contract_lifecycle.tools.clause_tools import extract_clauses
 
 logger = structlog.get_logger(__name__)
@@ -43,32 +44,32 @@ BACKSTORY = (
 # Contract type detection patterns
 # ---------------------------------------------------------------------------
 
-_TYPE_PATTERNS: dict[ContractType, list[re.Pattern[str]]] = {
-    ContractType.NDA: [
+_TYPE_PATTERNS: dict[ContractType, tuple[re.Pattern[str], ...]] = {
+    ContractType.NDA: (
         re.compile(r"non-disclosure\s+agreement|nda|confidentiality\s+agreement", re.IGNORECASE),
-    ],
-    ContractType.SAAS_AGREEMENT: [
+    ),
+    ContractType.SAAS_AGREEMENT: (
         re.compile(r"saas\s+agreement|software.as.a.service|subscription\s+agreement", re.IGNORECASE),
-    ],
-    ContractType.VENDOR_MSA: [
+    ),
+    ContractType.VENDOR_MSA: (
         re.compile(r"master\s+service\s+agreement|msa|vendor\s+agreement", re.IGNORECASE),
-    ],
-    ContractType.EMPLOYMENT: [
+    ),
+    ContractType.EMPLOYMENT: (
         re.compile(r"employment\s+agreement|offer\s+letter|employment\s+contract", re.IGNORECASE),
-    ],
-    ContractType.CONSULTING: [
+    ),
+    ContractType.CONSULTING: (
         re.compile(r"consulting\s+agreement|consultant\s+contract|independent\s+contractor", re.IGNORECASE),
-    ],
-    ContractType.LICENSING: [
+    ),
+    ContractType.LICENSING: (
         re.compile(r"licen[sc]ing\s+agreement|license\s+agreement|licen[sc]e\s+grant", re.IGNORECASE),
-    ],
+    ),
 }
 
 # ---------------------------------------------------------------------------
 # Party extraction patterns
 # ---------------------------------------------------------------------------
 
-_PARTY_PATTERNS: list[re.Pattern[str]] = [
+_PARTY_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(
         r'by\s+and\s+between\s+(.+?)\s*\(".*?"\)\s+and\s+(.+?)\s*\(".*?"\)',
         re.IGNORECASE,
@@ -77,13 +78,13 @@ _PARTY_PATTERNS: list[re.Pattern[str]] = [
         r'between\s+(.+?)\s*\(".*?"\)\s+and\s+(.+?)\s*\(".*?"\)',
         re.IGNORECASE,
     ),
-]
+)
 
 # ---------------------------------------------------------------------------
 # Date extraction patterns
 # ---------------------------------------------------------------------------
 
-_DATE_PATTERNS: list[re.Pattern[str]] = [
+_DATE_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(
         r"(?:effective\s+(?:date|as\s+of)|entered\s+into\s+as\s+of|commenc(?:e|ing)\s+on)\s+"
         r"(\w+\s+\d{1,2},?\s+\d{4})",
@@ -93,25 +94,45 @@ _DATE_PATTERNS: list[re.Pattern[str]] = [
         r"(?:as\s+of)\s+(\w+\s+\d{1,2},?\s+\d{4})",
         re.IGNORECASE,
     ),
-]
+)
 
-_EXPIRATION_PATTERNS: list[re.Pattern[str]] = [
+_EXPIRATION_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(
         r"(?:initial\s+term\s+of|continue\s+for)\s+"
         r"(?:an?\s+)?(\w+)\s*\(?\d*\)?\s*(?:months?|years?)",
         re.IGNORECASE,
     ),
-]
+)
 
 # ---------------------------------------------------------------------------
 # Value extraction patterns
 # ---------------------------------------------------------------------------
 
-_VALUE_PATTERNS: list[re.Pattern[str]] = [
+_VALUE_PATTERNS: tuple[re.Pattern[str], ...] = (
     re.compile(r"(?:total\s+(?:contract\s+)?value|total\s+compensation)[:\s]*\$?([\d,]+(?:\.\d+)?)", re.IGNORECASE),
     re.compile(r"\$([\d,]+(?:\.\d+)?)\s*(?:annually|per\s+year|per\s+annum)", re.IGNORECASE),
     re.compile(r"(?:annual|yearly)\s+.*?\$?([\d,]+(?:\.\d+)?)", re.IGNORECASE),
-]
+)
+
+
+# ---------------------------------------------------------------------------
+# Pattern matching
+# ---------------------------------------------------------------------------
+
+
+def _search(pattern: re.Pattern[str], text: str, folded: str | None) -> re.Match[str] | None:
+    """Search *text* with *pattern*, via *folded* when it is given.
+
+    *folded* is ``text.lower()`` for ASCII text (see :func:`ascii_flag`).
+    The patterns above are lowercase and case-insensitive, so matching
+    their case-sensitive ASCII twins (from the shared :func:`compiled`
+    cache) against it finds the same spans, and the engine can skip
+    ahead to where a match can start. Callers slice captured values
+    from *text* by span to keep the original casing.
+    """
+    if folded is None:
+        return pattern.search(text)
+    return compiled(pattern.pattern, re.ASCII).search(folded)
 
 
 class LegalAnalystAgent:
@@ -142,11 +163,13 @@ class LegalAnalystAgent:
         """
         logger.info("legal_analyst_starting", text_length=len(contract_text))
 
-        contract_type = self._detect_contract_type(contract_text)
-        parties = self._extract_parties(contract_text)
-        effective_date = self._extract_effective_date(contract_text)
-        expiration_date = self._extract_expiration_date(contract_text)
-        total_value = self._extract_value(contract_text)
+        # Case-fold ASCII contracts once for all of the heuristics below
+        folded = contract_text.lower() if ascii_flag(contract_text) else None
+        contract_type = self._detect_contract_type(contract_text, folded)
+        parties = self._extract_parties(contract_text, folded)
+        effective_date = self._extract_effective_date(contract_text, folded)
+        expiration_date = self._extract_expiration_date(contract_text, folded)
+        total_value = self._extract_value(contract_text, folded)
         clauses = extract_clauses(contract_text)
         summary = self._generate_summary(
             contract_type, parties, clauses, total_value
@@ -171,35 +194,38 @@ class LegalAnalystAgent:
         )
         return analysis
 
-    def _detect_contract_type(self, text: str) -> ContractType:
+    def _detect_contract_type(self, text: str, folded: str | None = None) -> ContractType:
         """Detect the contract type from title and content patterns."""
         for ctype, patterns in _TYPE_PATTERNS.items():
             for pattern in patterns:
-                if pattern.search(text):
+                if _search(pattern, text, folded):
                     return ctype
         return ContractType.CONSULTING  # Default fallback
 
-    def _extract_parties(self, text: str) -> list[str]:
+    def _extract_parties(self, text: str, folded: str | None = None) -> list[str]:
         """Extract party names from the contract text."""
         for pattern in _PARTY_PATTERNS:
-            match = pattern.search(text)
+            match = _search(pattern, text, folded)
             if match:
-                parties = [match.group(1).strip(), match.group(2).strip()]
+                parties = [
+                    text[slice(*match.span(1))].strip(),
+                    text[slice(*match.span(2))].strip(),
+                ]
                 return parties
         return []
 
-    def _extract_effective_date(self, text: str) -> str:
+    def _extract_effective_date(self, text: str, folded: str | None = None) -> str:
         """Extract the effective/commencement date."""
         for pattern in _DATE_PATTERNS:
-            match = pattern.search(text)
+            match = _search(pattern, text, folded)
             if match:
-                return match.group(1).strip()
+                return text[slice(*match.span(1))].strip()
         return ""
 
-    def _extract_expiration_date(self, text: str) -> str:
+    def _extract_expiration_date(self, text: str, folded: str | None = None) -> str:
         """Extract or compute the expiration date from term clauses."""
         for pattern in _EXPIRATION_PATTERNS:
-            match = pattern.search(text)
+            match = _search(pattern, text, folded)
             if match:
                 term_word = match.group(1).lower()
                 # Map common English numbers to digits
@@ -217,10 +243,10 @@ class LegalAnalystAgent:
                 return f"{months} months from effective date"
         return ""
 
-    def _extract_value(self, text: str) -> float:
+    def _extract_value(self, text: str, folded: str | None = None) -> float:
         """Extract the total contract value."""
         for pattern in _VALUE_PATTERNS:
-            match = pattern.search(text)
+            match = _search(pattern, text, folded)
             if match:
                 value_str = match.group(1).replace(",", "")
                 try:
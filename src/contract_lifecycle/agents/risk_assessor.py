@@ -196,6 +196,33 @@ _RISK_RULES: list[dict[str, object]] = [
     },
 ]
 
+# Precomputed per-flag assessment: risk level, description, recommendation
+# and resolved precedent reference
+_RubricRow = tuple[RiskLevel, str, str, str | None]
+
+_HIGH_RISK_LEVELS = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+
+
+def _build_rubric() -> dict[str, _RubricRow]:
+    """Index the risk rules by flag and resolve their precedent references."""
+    rubric: dict[str, _RubricRow] = {}
+    for rule in _RISK_RULES:
+        precedent_key = str(rule.get("precedent_key", ""))
+        rubric.setdefault(
+            str(rule["flag"]),
+            (
+                rule["risk_level"],  # type: ignore[arg-type]
+                str(rule["description"]),
+                str(rule["recommendation"]),
+                lookup_precedent(precedent_key),
+            ),
+        )
+    return rubric
+
+
+# Flag -> rubric row; the rules and precedents are static, so built once
+_RUBRIC: dict[str, _RubricRow] = _build_rubric()
+
 
 class RiskAssessorAgent:
     """Risk Assessment Specialist agent.
@@ -235,6 +262,7 @@ class RiskAssessorAgent:
             contract_type=contract_type.value,
         )
 
+        rubric = _RUBRIC
         assessments: list[RiskAssessment] = []
 
         for clause in clauses:
@@ -254,28 +282,22 @@ class RiskAssessorAgent:
                 )
                 continue
 
-            # Find the highest-severity rule that matches
-            for flag in clause.risk_flags:
-                rule = self._find_rule(flag)
-                if rule is None:
-                    continue
-
-                # Lookup precedent
-                precedent_key = str(rule.get("precedent_key", ""))
-                precedent_ref = lookup_precedent(precedent_key)
+            rows = [rubric[flag] for flag in clause.risk_flags if flag in rubric]
+            if not rows:
+                continue
 
-                # Estimate liability if relevant
-                liability = estimate_liability(clause.text)
-                description = str(rule["description"])
-                if liability > 0:
-                    description += f" Estimated liability exposure: ${liability:,.2f}."
+            # Liability depends only on the clause text, so estimate it once
+            # for all of the clause's matching rules
+            liability = estimate_liability(clause.text)
+            exposure = f" Estimated liability exposure: ${liability:,.2f}." if liability > 0 else ""
 
+            for risk_level, description, recommendation, precedent_ref in rows:
                 assessments.append(
                     RiskAssessment(
                         clause_id=clause.id,
-                        risk_level=rule["risk_level"],  # type: ignore[arg-type]
-                        description=description,
-                        recommendation=str(rule["recommendation"]),
+                        risk_level=risk_level,
+                        description=description + exposure,
+                        recommendation=recommendation,
                         precedent_reference=precedent_ref,
                     )
                 )
@@ -283,13 +305,6 @@ class RiskAssessorAgent:
         logger.info(
             "risk_assessment_complete",
             assessments=len(assessments),
-            high_risk=sum(1 for a in assessments if a.risk_level in (RiskLevel.HIGH, RiskLevel.CRITICAL)),
+            high_risk=sum(1 for a in assessments if a.risk_level in _HIGH_RISK_LEVELS),
         )
         return assessments
-
-    def _find_rule(self, flag: str) -> dict[str, object] | None:
-        """Find the risk rule matching a given flag name."""
-        for rule in _RISK_RULES:
-            if rule["flag"] == flag:
-                return rule
-        return None
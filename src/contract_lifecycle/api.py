@@ -32,10 +32,14 @@ from contract_lifecycle.mock_data.contracts import MOCK_CONTRACTS
 from contract_lifecycle.mock_data.templates import CONTRACT_TEMPLATES
 from contract_lifecycle.models import (
     ApprovalDecision,
+    ApprovalDecisionAPI,
     ApprovalLevel,
+    ContractEventAPI,
     ContractSession,
     ContractType,
     LifecycleStage,
+    NegotiationPositionAPI,
+    RiskAssessmentAPI,
     RiskLevel,
 )
 from contract_lifecycle.streaming import (
@@ -110,7 +114,7 @@ class SessionManager:
 
     def create_session(self, contract_text: str) -> ContractSession:
         """Create a new contract session."""
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
         session = ContractSession(
             id=session_id,
             state=LifecycleStage.INTAKE,
@@ -306,7 +310,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             async for event in state.event_stream.subscribe(contract_id):
                 yield {
                     "event": event.event_type,
-                    "data": json.dumps(event.model_dump(), default=str),
+                    "data": json.dumps(ContractEventAPI.dump_python(event), default=str),
                 }
 
         return EventSourceResponse(event_generator())
@@ -368,7 +372,8 @@ def create_app(settings: Settings | None = None) -> FastAPI:
                 event_type=EVENT_APPROVED,
                 data={
                     "approval_chain": [
-                        d.model_dump() for d in session.approval_chain
+                        ApprovalDecisionAPI.dump_python(d)
+                        for d in session.approval_chain
                     ]
                 },
                 message="All approvals received. Contract approved.",
@@ -587,7 +592,9 @@ def create_app(settings: Settings | None = None) -> FastAPI:
             "analysis": (
                 session.analysis.model_dump() if session.analysis else None
             ),
-            "risk_assessments": [r.model_dump() for r in session.risk_assessments],
+            "risk_assessments": [
+                RiskAssessmentAPI.dump_python(r) for r in session.risk_assessments
+            ],
             "risk_summary": {
                 "total": len(session.risk_assessments),
                 "low": sum(
@@ -607,8 +614,12 @@ def create_app(settings: Settings | None = None) -> FastAPI:
                     if r.risk_level == RiskLevel.CRITICAL
                 ),
             },
-            "negotiations": [n.model_dump() for n in session.negotiations],
-            "approval_chain": [a.model_dump() for a in session.approval_chain],
+            "negotiations": [
+                NegotiationPositionAPI.dump_python(n) for n in session.negotiations
+            ],
+            "approval_chain": [
+                ApprovalDecisionAPI.dump_python(a) for a in session.approval_chain
+            ],
             "versions": [v.model_dump() for v in session.versions],
             "created_at": session.created_at.isoformat(),
             "updated_at": session.updated_at.isoformat(),
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from common.config import Settings as BaseSettings
 
 
@@ -18,6 +20,11 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8014
 
+    # Server runtime (uvicorn event loop and HTTP protocol implementations).
+    # "auto" picks uvloop/httptools when installed, asyncio/h11 otherwise.
+    event_loop: Literal["auto", "asyncio", "uvloop"] = "auto"
+    http_impl: Literal["auto", "h11", "httptools"] = "auto"
+
     # LLM configuration
     default_model: str = "gpt-4o-mini"
 
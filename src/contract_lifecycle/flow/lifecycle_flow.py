@@ -9,8 +9,6 @@ negotiation/approval -> execution.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
-from typing import Any
 
 import structlog
 
@@ -26,6 +24,7 @@ from contract_lifecycle.flow.state import ContractFlowState
 from contract_lifecycle.models import (
     ApprovalDecision,
     ApprovalLevel,
+    ContractType,
     ContractVersion,
     LifecycleStage,
     RiskLevel,
@@ -155,14 +154,15 @@ class ContractLifecycleFlow:
             )
 
         except Exception as exc:
-            logger.error("flow_error", error=str(exc), session_id=session_id)
-            state.error = str(exc)
+            error_message = str(exc)
+            logger.error("flow_error", error=error_message, session_id=session_id)
+            state.error = error_message
             state.stage = LifecycleStage.FAILED
             await event_stream.emit(
                 session_id=session_id,
                 event_type=EVENT_ERROR,
-                data={"error": str(exc)},
-                message=f"Flow error: {exc}",
+                data={"error": error_message},
+                message=f"Flow error: {error_message}",
             )
 
         return state
@@ -356,7 +356,7 @@ class ContractLifecycleFlow:
         contract_value = state.analysis.total_value if state.analysis else 0.0
         contract_type = (
             state.analysis.contract_type if state.analysis
-            else __import__("contract_lifecycle.models", fromlist=["ContractType"]).ContractType.CONSULTING
+            else ContractType.CONSULTING
         )
 
         approval_result = await self._approval_crew.kickoff(
@@ -474,7 +474,7 @@ class ContractLifecycleFlow:
         contract_value = state.analysis.total_value if state.analysis else 0.0
         contract_type = (
             state.analysis.contract_type if state.analysis
-            else __import__("contract_lifecycle.models", fromlist=["ContractType"]).ContractType.CONSULTING
+            else ContractType.CONSULTING
         )
 
         approval_result = await self._approval_crew.kickoff(
@@ -11,11 +11,14 @@ from typing import Any
 
 from contract_lifecycle.models import (
     ApprovalDecision,
+    ApprovalDecisionAPI,
     ContractAnalysis,
     ContractVersion,
     LifecycleStage,
     NegotiationPosition,
+    NegotiationPositionAPI,
     RiskAssessment,
+    RiskAssessmentAPI,
     RiskLevel,
 )
 
@@ -66,9 +69,13 @@ class ContractFlowState:
             "contract_text_length": len(self.contract_text),
             "stage": self.stage.value,
             "analysis": self.analysis.model_dump() if self.analysis else None,
-            "risks": [r.model_dump() for r in self.risks],
-            "negotiations": [n.model_dump() for n in self.negotiations],
-            "approval_chain": [a.model_dump() for a in self.approval_chain],
+            "risks": [RiskAssessmentAPI.dump_python(r) for r in self.risks],
+            "negotiations": [
+                NegotiationPositionAPI.dump_python(n) for n in self.negotiations
+            ],
+            "approval_chain": [
+                ApprovalDecisionAPI.dump_python(a) for a in self.approval_chain
+            ],
             "current_approval_index": self.current_approval_index,
             "overall_risk": self.overall_risk.value if self.overall_risk else None,
             "versions": [v.model_dump() for v in self.versions],
@@ -53,6 +53,8 @@ def main() -> None:
         host=settings.host,
         port=settings.port,
         log_level=settings.log_level.lower(),
+        loop=settings.event_loop,
+        http=settings.http_impl,
     )
 
 
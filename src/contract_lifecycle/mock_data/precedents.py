@@ -6,10 +6,19 @@ Maps clause types to outcomes and recommendations drawn from
 
 from __future__ import annotations
 
+import bisect
+import sys
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
-@dataclass
+
+@dataclass(frozen=True)
 class Precedent:
     """A single legal precedent entry."""
 
@@ -23,7 +32,7 @@ class Precedent:
     risk_impact: str  # "increases_risk" | "decreases_risk" | "neutral"
 
 
-PRECEDENT_DATABASE: list[Precedent] = [
+PRECEDENT_DATABASE: tuple[Precedent, ...] = (
     Precedent(
         id="PREC-001",
         clause_type="unlimited_liability",
@@ -190,7 +199,88 @@ PRECEDENT_DATABASE: list[Precedent] = [
         ),
         risk_impact="decreases_risk",
     ),
-]
+)
+
+
+# ---------------------------------------------------------------------------
+# Lookup index (built once at import)
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class _PrecedentColumns:
+    """Struct-of-arrays view over the fields used to match precedents.
+
+    Lookups and filters scan these parallel columns; the full
+    :class:`Precedent` row is only touched for the entries returned.
+    """
+
+    clause_types: tuple[str, ...]
+    jurisdictions: tuple[str, ...]  # lower-cased for matching
+    years: array[int]
+    risk_impacts: tuple[str, ...]
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Precedent]) -> _PrecedentColumns:
+        """Build the columns from precedent rows, preserving order."""
+        return cls(
+            clause_types=tuple(sys.intern(p.clause_type) for p in rows),
+            jurisdictions=tuple(p.jurisdiction.lower() for p in rows),
+            years=array("H", (p.year for p in rows)),
+            risk_impacts=tuple(sys.intern(p.risk_impact) for p in rows),
+        )
+
+
+_COLUMNS = _PrecedentColumns.from_rows(PRECEDENT_DATABASE)
+
+# Clause types joined into one newline-separated string so "query
+# contained in a clause type" is a single str.find scan.
+_JOINED_CLAUSE_TYPES = "\n".join(_COLUMNS.clause_types)
+_CLAUSE_TYPE_OFFSETS: tuple[int, ...] = tuple(
+    accumulate((len(ct) + 1 for ct in _COLUMNS.clause_types), initial=0)
+)[:-1]
+
+
+@lru_cache(maxsize=512)
+def _normalize(clause_type: str) -> str:
+    """Normalize a clause type query to the database's snake_case form.
+
+    Queries come from a small fixed vocabulary, so results are cached and
+    interned.
+    """
+    return sys.intern(clause_type.lower().replace(" ", "_").replace("-", "_"))
+
+
+def _find_precedent_index(normalized: str) -> int | None:
+    """Return the database index of the first precedent matching *normalized*.
+
+    A precedent matches when its clause type contains the query or the
+    query contains its clause type.
+    """
+    clause_types = _COLUMNS.clause_types
+    limit = len(clause_types)
+    contained_at: int | None = None
+    if "\n" not in normalized:
+        pos = _JOINED_CLAUSE_TYPES.find(normalized)
+        if pos != -1:
+            contained_at = bisect.bisect_right(_CLAUSE_TYPE_OFFSETS, pos) - 1
+            limit = contained_at
+
+    # Only earlier entries can still win via the reverse containment check
+    for index in range(limit):
+        if clause_types[index] in normalized:
+            return index
+    return contained_at
+
+
+# Canonical clause type -> precedent. Callers almost always pass a
+# database clause type verbatim, so this answers the common case with one
+# dict probe. Each entry is resolved through the scan above, so an exact
+# hit returns the same precedent the containment rules would.
+_EXACT: dict[str, Precedent] = {
+    clause_type: PRECEDENT_DATABASE[index]
+    for clause_type in _COLUMNS.clause_types
+    if (index := _find_precedent_index(clause_type)) is not None
+}
 
 
 def lookup_precedent(clause_type: str) -> Precedent | None:
@@ -198,14 +288,50 @@ def lookup_precedent(clause_type: str) -> Precedent | None:
 
     Returns the first matching precedent or ``None`` if no match is found.
     """
-    # Normalize the search term
-    normalized = clause_type.lower().replace(" ", "_").replace("-", "_")
-    for precedent in PRECEDENT_DATABASE:
-        if normalized in precedent.clause_type or precedent.clause_type in normalized:
-            return precedent
-    return None
+    normalized = _normalize(clause_type)
+    hit = _EXACT.get(normalized)
+    if hit is not None:
+        return hit
+    index = _find_precedent_index(normalized)
+    return get_precedent(index) if index is not None else None
+
+
+def get_precedent(index: int) -> Precedent:
+    """Return the precedent stored at *index* in the database."""
+    return PRECEDENT_DATABASE[index]
+
+
+def filter_precedents(
+    jurisdiction: str | None = None,
+    min_year: int | None = None,
+    risk_impact: str | None = None,
+) -> list[Precedent]:
+    """Return precedents matching all of the given criteria.
+
+    Args:
+        jurisdiction: Jurisdiction name (case-insensitive), e.g. ``"Delaware"``.
+        min_year: Earliest decision year to include.
+        risk_impact: One of ``"increases_risk"``, ``"decreases_risk"``,
+            or ``"neutral"``.
+
+    Returns:
+        Matching precedents in database order.
+    """
+    wanted_jurisdiction = jurisdiction.lower() if jurisdiction is not None else None
+    matches: list[Precedent] = []
+    for index, (row_jurisdiction, year, impact) in enumerate(
+        zip(_COLUMNS.jurisdictions, _COLUMNS.years, _COLUMNS.risk_impacts, strict=True)
+    ):
+        if wanted_jurisdiction is not None and row_jurisdiction != wanted_jurisdiction:
+            continue
+        if min_year is not None and year < min_year:
+            continue
+        if risk_impact is not None and impact != risk_impact:
+            continue
+        matches.append(get_precedent(index))
+    return matches
 
 
-def get_all_precedents() -> list[Precedent]:
-    """Return the full precedent database."""
-    return list(PRECEDENT_DATABASE)
+def get_all_precedents() -> tuple[Precedent, ...]:
+    """Return the full (immutable) precedent database."""
+    return PRECEDENT_DATABASE
@@ -6,6 +6,13 @@ negotiation recommendations by the negotiation strategist agent.
 
 from __future__ import annotations
 
+import sys
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 # ---------------------------------------------------------------------------
 # Standard safe clause templates by category
 # ---------------------------------------------------------------------------
@@ -89,7 +96,7 @@ FORCE_MAJEURE_STANDARD = (
 # Templates organized by contract type
 # ---------------------------------------------------------------------------
 
-SAAS_AGREEMENT_TEMPLATES: dict[str, str] = {
+SAAS_AGREEMENT_TEMPLATES: Mapping[str, str] = MappingProxyType({
     "limitation_of_liability": LIMITATION_OF_LIABILITY_SAFE,
     "auto_renewal": AUTO_RENEWAL_SAFE,
     "termination": TERMINATION_BALANCED,
@@ -99,15 +106,15 @@ SAAS_AGREEMENT_TEMPLATES: dict[str, str] = {
     "sla": SLA_WITH_TEETH,
     "data_protection": DATA_PROTECTION_GDPR,
     "force_majeure": FORCE_MAJEURE_STANDARD,
-}
+})
 
-NDA_TEMPLATES: dict[str, str] = {
+NDA_TEMPLATES: Mapping[str, str] = MappingProxyType({
     "confidentiality": CONFIDENTIALITY_STANDARD,
     "non_compete": NON_COMPETE_SAFE,
     "termination": TERMINATION_BALANCED,
-}
+})
 
-VENDOR_MSA_TEMPLATES: dict[str, str] = {
+VENDOR_MSA_TEMPLATES: Mapping[str, str] = MappingProxyType({
     "limitation_of_liability": LIMITATION_OF_LIABILITY_SAFE,
     "termination": TERMINATION_BALANCED,
     "ip_ownership": IP_OWNERSHIP_BALANCED,
@@ -115,36 +122,50 @@ VENDOR_MSA_TEMPLATES: dict[str, str] = {
     "indemnification": INDEMNIFICATION_MUTUAL,
     "data_protection": DATA_PROTECTION_GDPR,
     "force_majeure": FORCE_MAJEURE_STANDARD,
-}
+})
 
-EMPLOYMENT_TEMPLATES: dict[str, str] = {
+EMPLOYMENT_TEMPLATES: Mapping[str, str] = MappingProxyType({
     "non_compete": NON_COMPETE_SAFE,
     "confidentiality": CONFIDENTIALITY_STANDARD,
     "ip_ownership": IP_OWNERSHIP_BALANCED,
     "termination": TERMINATION_BALANCED,
-}
+})
 
-CONSULTING_TEMPLATES: dict[str, str] = {
+CONSULTING_TEMPLATES: Mapping[str, str] = MappingProxyType({
     "limitation_of_liability": LIMITATION_OF_LIABILITY_SAFE,
     "termination": TERMINATION_BALANCED,
     "ip_ownership": IP_OWNERSHIP_BALANCED,
     "confidentiality": CONFIDENTIALITY_STANDARD,
     "indemnification": INDEMNIFICATION_MUTUAL,
-}
+})
 
-LICENSING_TEMPLATES: dict[str, str] = {
+LICENSING_TEMPLATES: Mapping[str, str] = MappingProxyType({
     "limitation_of_liability": LIMITATION_OF_LIABILITY_SAFE,
     "termination": TERMINATION_BALANCED,
     "ip_ownership": IP_OWNERSHIP_BALANCED,
     "confidentiality": CONFIDENTIALITY_STANDARD,
     "indemnification": INDEMNIFICATION_MUTUAL,
-}
+})
 
-CONTRACT_TEMPLATES: dict[str, dict[str, str]] = {
+CONTRACT_TEMPLATES: Mapping[str, Mapping[str, str]] = MappingProxyType({
     "saas_agreement": SAAS_AGREEMENT_TEMPLATES,
     "nda": NDA_TEMPLATES,
     "vendor_msa": VENDOR_MSA_TEMPLATES,
     "employment": EMPLOYMENT_TEMPLATES,
     "consulting": CONSULTING_TEMPLATES,
     "licensing": LICENSING_TEMPLATES,
-}
+})
+
+# Flattened (contract_type, clause_name) -> template index so a single
+# clause resolves with one hash probe. Template values are shared
+# constants above, so the index holds no duplicate strings.
+FLAT_TEMPLATES: Mapping[tuple[str, str], str] = MappingProxyType({
+    (sys.intern(contract_type), sys.intern(clause_name)): template
+    for contract_type, templates in CONTRACT_TEMPLATES.items()
+    for clause_name, template in templates.items()
+})
+
+
+def get_template(contract_type: str, clause_name: str) -> str | None:
+    """Return the safe template for a normalized contract type and clause name."""
+    return FLAT_TEMPLATES.get((contract_type, clause_name))
@@ -1,18 +1,25 @@
-"""Pydantic models for the Contract Lifecycle Crew.
+"""Domain models for the Contract Lifecycle Crew.
 
 Defines all domain objects used across agents, crews, flows, and API
 endpoints: contract types, risk levels, lifecycle stages, clauses, risk
 assessments, negotiation positions, approval decisions, and session state.
+
+Objects created in bulk by the pipeline (clauses, assessments, positions,
+decisions, events) are slotted dataclasses that skip validation; the
+aggregate analysis/session objects are Pydantic models, and the
+``*API`` type adapters serialize the dataclasses at the API edge.
 """
 
 from __future__ import annotations
 
+import itertools
 import uuid
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 # ---------------------------------------------------------------------------
@@ -65,23 +72,58 @@ class ApprovalLevel(str, Enum):
     CFO = "cfo"
 
 
+# ---------------------------------------------------------------------------
+# Default factories
+# ---------------------------------------------------------------------------
+
+_UTC = timezone.utc
+
+
+_clause_counter = itertools.count(1)
+
+
+def _make_clause_id() -> str:
+    """Return the next process-unique clause identifier (8 hex digits).
+
+    ``next()`` on an ``itertools.count`` is atomic under the GIL, so ids
+    never collide across threads, unlike 32 random bits from a UUID.
+    """
+    return format(next(_clause_counter), "08x")
+
+
+def _session_id() -> str:
+    """Return a globally unique session identifier."""
+    return uuid.uuid4().hex
+
+
+def _utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime.
+
+    ``datetime.now`` with a tzinfo is already the cheapest aware
+    constructor; ``fromtimestamp(time.time(), tz)`` measures slower.
+    """
+    return datetime.now(_UTC)
+
+
 # ---------------------------------------------------------------------------
 # Domain models
 # ---------------------------------------------------------------------------
 
 
-class Clause(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Clause:
     """A single clause extracted from a contract."""
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=_make_clause_id)
     title: str
     text: str
     section: str = ""
     is_standard: bool = True
-    risk_flags: list[str] = Field(default_factory=list)
+    risk_flags: list[str] = field(default_factory=list)
 
 
-class RiskAssessment(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class RiskAssessment:
     """Risk evaluation of a specific clause."""
 
     clause_id: str
@@ -91,24 +133,26 @@ class RiskAssessment(BaseModel):
     precedent_reference: str | None = None
 
 
-class NegotiationPosition(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class NegotiationPosition:
     """Negotiation strategy for a flagged clause."""
 
     clause_id: str
     current_terms: str
     proposed_terms: str
     rationale: str
-    leverage_points: list[str] = Field(default_factory=list)
+    leverage_points: list[str] = field(default_factory=list)
 
 
-class ApprovalDecision(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ApprovalDecision:
     """Decision made at a single approval level."""
 
     level: ApprovalLevel
     approver: str
     decision: str = "pending"  # pending | approved | rejected
     comments: str = ""
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    timestamp: datetime = field(default_factory=_utc_now)
 
 
 class ContractAnalysis(BaseModel):
@@ -128,13 +172,13 @@ class ContractVersion(BaseModel):
 
     version: int
     changes: list[str] = Field(default_factory=list)
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    timestamp: datetime = Field(default_factory=_utc_now)
 
 
 class ContractSession(BaseModel):
     """Top-level session tracking the full lifecycle of a contract."""
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_session_id)
     state: LifecycleStage = LifecycleStage.INTAKE
     contract_text: str = ""
     contract_type: ContractType | None = None
@@ -145,16 +189,28 @@ class ContractSession(BaseModel):
     versions: list[ContractVersion] = Field(default_factory=list)
     overall_risk: RiskLevel | None = None
     report: dict[str, Any] | None = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    created_at: datetime = Field(default_factory=_utc_now)
+    updated_at: datetime = Field(default_factory=_utc_now)
     error: str | None = None
 
 
-class ContractEvent(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ContractEvent:
     """SSE event emitted during contract lifecycle processing."""
 
     event_type: str
     session_id: str
-    data: dict[str, Any] = Field(default_factory=dict)
+    data: dict[str, Any] = field(default_factory=dict)
     message: str = ""
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    timestamp: datetime = field(default_factory=_utc_now)
+
+
+# ---------------------------------------------------------------------------
+# Serialization adapters for the dataclass models
+# ---------------------------------------------------------------------------
+
+ClauseAPI: TypeAdapter[Clause] = TypeAdapter(Clause)
+RiskAssessmentAPI: TypeAdapter[RiskAssessment] = TypeAdapter(RiskAssessment)
+NegotiationPositionAPI: TypeAdapter[NegotiationPosition] = TypeAdapter(NegotiationPosition)
+ApprovalDecisionAPI: TypeAdapter[ApprovalDecision] = TypeAdapter(ApprovalDecision)
+ContractEventAPI: TypeAdapter[ContractEvent] = TypeAdapter(ContractEvent)
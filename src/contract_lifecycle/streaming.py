@@ -7,7 +7,8 @@ API endpoints consume via ``async for`` iteration.
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timezone
+import logging
+from collections import deque
 from typing import Any, AsyncIterator
 
 import structlog
@@ -38,18 +39,127 @@ EVENT_EXECUTED = "executed"
 EVENT_COMPLETED = "completed"
 EVENT_ERROR = "error"
 
+# Events after which a session's subscribers stop iterating
+_TERMINAL_EVENTS = frozenset({EVENT_COMPLETED, EVENT_ERROR})
+
+# Seconds a finished session's history is kept for late subscribers
+_HISTORY_TTL_SECONDS = 60.0
+
+# Fan-out coalescing: events are delivered to subscribers in batches,
+# flushed after this many seconds or once this many events are pending.
+_FLUSH_INTERVAL_SECONDS = 0.005
+_MAX_BATCH_SIZE = 32
+
+# Subscriber queues carry batches of events
+_EventBatch = tuple[ContractEvent, ...]
+
+
+class QueueShutDown(Exception):
+    """Raised by :class:`RingEventQueue` once it has been shut down."""
+
+
+class RingEventQueue:
+    """Single-consumer queue of event batches for one subscriber.
+
+    Batches live in a preallocated power-of-two ring indexed by masked
+    head/tail counters, and a single :class:`asyncio.Event` wakes the
+    consumer, so a put is a list store rather than a trip through
+    ``asyncio.Queue``'s getter futures. The queue holds at most *capacity*
+    items; when full, :meth:`put_nowait` drops the oldest one.
+    :meth:`shutdown` follows ``asyncio.Queue.shutdown()`` (Python 3.13+):
+    queued items are still delivered, then :meth:`get` raises
+    :class:`QueueShutDown`.
+    """
+
+    __slots__ = ("_buf", "_capacity", "_head", "_is_shutdown", "_mask", "_ready", "_tail")
+
+    def __init__(self, capacity: int = 256) -> None:
+        size = 1 << (max(capacity, 1) - 1).bit_length()
+        self._buf: list[_EventBatch | None] = [None] * size
+        self._mask = size - 1
+        self._capacity = max(capacity, 1)
+        self._head = 0
+        self._tail = 0
+        self._ready = asyncio.Event()
+        self._is_shutdown = False
+
+    def __len__(self) -> int:
+        return self._head - self._tail
+
+    def put_nowait(self, item: _EventBatch) -> bool:
+        """Enqueue *item*, dropping the oldest entry if the queue is full.
+
+        Returns ``True`` if an entry had to be evicted. Raises
+        :class:`QueueShutDown` if the queue has been shut down.
+        """
+        if self._is_shutdown:
+            raise QueueShutDown
+        evicted = self._head - self._tail == self._capacity
+        if evicted:
+            self._buf[self._tail & self._mask] = None
+            self._tail += 1
+        self._buf[self._head & self._mask] = item
+        self._head += 1
+        self._ready.set()
+        return evicted
+
+    async def get(self) -> _EventBatch:
+        """Remove and return the oldest item, waiting until one is available.
+
+        Raises :class:`QueueShutDown` once the queue is shut down and empty.
+        """
+        while self._head == self._tail:
+            if self._is_shutdown:
+                raise QueueShutDown
+            self._ready.clear()
+            await self._ready.wait()
+        index = self._tail & self._mask
+        item = self._buf[index]
+        self._buf[index] = None
+        self._tail += 1
+        return item  # type: ignore[return-value]
+
+    def shutdown(self) -> None:
+        """Refuse further puts and end :meth:`get` once the queue drains."""
+        self._is_shutdown = True
+        self._ready.set()
+
 
 class ContractEventStream:
     """In-memory pub/sub for contract lifecycle SSE events.
 
-    Each contract session gets its own ``asyncio.Queue`` so that multiple
-    SSE subscribers can consume events independently.
+    Each SSE subscriber gets its own bounded :class:`RingEventQueue` so that
+    multiple subscribers can consume events independently. Events are
+    coalesced per session and fanned out as batches, at most
+    *flush_interval* seconds or *max_batch_size* events apart; terminal
+    events flush immediately. A subscriber that falls behind loses its
+    oldest queued batches rather than the newest, so terminal events always
+    get through. Per-session history is capped at *max_queue_size* events.
+    Once a session emits a ``completed`` or ``error`` event its history is
+    dropped *history_ttl* seconds after its last event; later events such
+    as approval decisions restart that countdown, including ones that
+    arrive after the history has already been dropped.
     """
 
-    def __init__(self, max_queue_size: int = 256) -> None:
-        self._queues: dict[str, list[asyncio.Queue[ContractEvent | None]]] = {}
+    def __init__(
+        self,
+        max_queue_size: int = 256,
+        history_ttl: float = _HISTORY_TTL_SECONDS,
+        flush_interval: float = _FLUSH_INTERVAL_SECONDS,
+        max_batch_size: int = _MAX_BATCH_SIZE,
+    ) -> None:
+        self._queues: dict[str, set[RingEventQueue]] = {}
         self._max_queue_size = max_queue_size
-        self._history: dict[str, list[ContractEvent]] = {}
+        self._history_ttl = history_ttl
+        self._history: dict[str, deque[ContractEvent]] = {}
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._pending: dict[str, list[ContractEvent]] = {}
+        self._flush_handles: dict[str, asyncio.TimerHandle] = {}
+        self._expiry_handles: dict[str, asyncio.TimerHandle] = {}
+        # Sessions that have emitted a terminal event, kept past expiry so
+        # a late approval event's fresh history expires too
+        self._finished: set[str] = set()
 
     # ------------------------------------------------------------------
     # Publishing
@@ -71,31 +181,57 @@ class ContractEventStream:
             session_id=session_id,
             data=data or {},
             message=message,
-            timestamp=datetime.now(tz=timezone.utc),
         )
 
-        # Persist in history
-        self._history.setdefault(session_id, []).append(event)
+        # Persist in (bounded) history
+        history = self._history.get(session_id)
+        if history is None:
+            history = self._history[session_id] = deque(maxlen=self._max_queue_size)
+        history.append(event)
+        if event_type in _TERMINAL_EVENTS:
+            self._finished.add(session_id)
+        if session_id in self._finished:
+            self._schedule_expiry(session_id, history)
+
+        # Queue for fan-out; nothing to do if no one is listening
+        if not self._queues.get(session_id):
+            return event
+        pending = self._pending.setdefault(session_id, [])
+        pending.append(event)
+        if event_type in _TERMINAL_EVENTS or len(pending) >= self._max_batch_size:
+            self._flush(session_id)
+        elif session_id not in self._flush_handles:
+            self._flush_handles[session_id] = asyncio.get_running_loop().call_later(
+                self._flush_interval, self._flush, session_id
+            )
+        return event
 
-        # Fan-out to all live subscriber queues
-        queues = self._queues.get(session_id, [])
+    def _flush(self, session_id: str) -> None:
+        """Deliver the pending events of *session_id* to every subscriber."""
+        handle = self._flush_handles.pop(session_id, None)
+        if handle is not None:
+            handle.cancel()
+        pending = self._pending.pop(session_id, None)
+        if not pending:
+            return
+
+        batch = tuple(pending)
+        queues = self._queues.get(session_id, ())
         for queue in queues:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
+            if queue.put_nowait(batch):
                 logger.warning(
                     "event_queue_full",
                     session_id=session_id,
-                    event_type=event_type,
+                    event_type=batch[-1].event_type,
                 )
 
-        logger.debug(
-            "event_emitted",
-            session_id=session_id,
-            event_type=event_type,
-            subscribers=len(queues),
-        )
-        return event
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "events_flushed",
+                session_id=session_id,
+                events=len(batch),
+                subscribers=len(queues),
+            )
 
     # ------------------------------------------------------------------
     # Subscribing
@@ -104,31 +240,44 @@ class ContractEventStream:
     async def subscribe(self, session_id: str) -> AsyncIterator[ContractEvent]:
         """Yield events for *session_id* as they arrive.
 
-        The iterator terminates when the session emits a ``completed`` or
-        ``error`` event, or when ``close(session_id)`` is called (which
-        pushes ``None`` as a sentinel).
+        The iterator terminates when a ``completed`` or ``error`` event
+        arrives live, when ``close(session_id)`` is called (which shuts
+        down the subscriber queues once their pending batches are
+        delivered), or when a finished session's history expires.
+        Replayed history never ends the iterator, so a late subscriber
+        still receives approval decisions emitted after ``completed``.
         """
-        queue: asyncio.Queue[ContractEvent | None] = asyncio.Queue(
-            maxsize=self._max_queue_size
-        )
-        self._queues.setdefault(session_id, []).append(queue)
+        history = tuple(self._history.get(session_id, ()))
 
-        # Replay any historical events first so late joiners catch up
-        for past_event in self._history.get(session_id, []):
-            yield past_event
+        # Register the queue in the same step as the snapshot above (no
+        # await in between), so every later event arrives exactly once via
+        # the queue even though emit() may run while replay is suspended.
+        # Pending events are already in the snapshot, so hand them to the
+        # existing subscribers before this queue joins.
+        self._flush(session_id)
+        queue = RingEventQueue(self._max_queue_size)
+        self._queues.setdefault(session_id, set()).add(queue)
 
         try:
+            # Replay historical events first so late joiners catch up
+            for past_event in history:
+                yield past_event
+
             while True:
-                event = await queue.get()
-                if event is None:
-                    break
-                yield event
-                if event.event_type in (EVENT_COMPLETED, EVENT_ERROR):
+                try:
+                    batch = await queue.get()
+                except QueueShutDown:
                     break
+                for event in batch:
+                    yield event
+                    if event.event_type in _TERMINAL_EVENTS:
+                        return
         finally:
-            session_queues = self._queues.get(session_id, [])
-            if queue in session_queues:
-                session_queues.remove(queue)
+            session_queues = self._queues.get(session_id)
+            if session_queues is not None:
+                session_queues.discard(queue)
+                if not session_queues:
+                    del self._queues[session_id]
 
     # ------------------------------------------------------------------
     # Lifecycle helpers
@@ -136,18 +285,38 @@ class ContractEventStream:
 
     def close(self, session_id: str) -> None:
         """Signal all subscribers of *session_id* to stop iterating."""
-        for queue in self._queues.get(session_id, []):
-            try:
-                queue.put_nowait(None)
-            except asyncio.QueueFull:
-                pass
-        self._queues.pop(session_id, None)
+        self._flush(session_id)
+        for queue in self._queues.pop(session_id, ()):
+            queue.shutdown()
+
+    def _schedule_expiry(self, session_id: str, history: deque[ContractEvent]) -> None:
+        """(Re)start the countdown that drops a finished session's history."""
+        handle = self._expiry_handles.get(session_id)
+        if handle is not None:
+            handle.cancel()
+        self._expiry_handles[session_id] = asyncio.get_running_loop().call_later(
+            self._history_ttl, self._expire_history, session_id, history
+        )
+
+    def _expire_history(self, session_id: str, history: deque[ContractEvent]) -> None:
+        """Drop a finished session's history and release its subscribers.
+
+        Does nothing if the history has been replaced since scheduling.
+        """
+        self._expiry_handles.pop(session_id, None)
+        if self._history.get(session_id) is history:
+            del self._history[session_id]
+            self.close(session_id)
 
     def get_history(self, session_id: str) -> list[ContractEvent]:
         """Return all events emitted for a given session."""
-        return list(self._history.get(session_id, []))
+        return list(self._history.get(session_id, ()))
 
     def clear(self, session_id: str) -> None:
         """Remove all state associated with a session."""
         self.close(session_id)
         self._history.pop(session_id, None)
+        self._finished.discard(session_id)
+        handle = self._expiry_handles.pop(session_id, None)
+        if handle is not None:
+            handle.cancel()
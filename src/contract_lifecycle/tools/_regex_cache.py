@@ -0,0 +1,36 @@
+"""Shared compiled-pattern cache for the regex-based tools.
+
+Tool modules keep their patterns as ``(pattern, flags)`` source constants
+and compile them through :func:`compiled` on first use, so importing a
+tool costs no regex compilation and patterns that are never exercised
+are never built. :func:`ascii_flag` lets callers match plain-ASCII input
+with ASCII-only character classes and case folding.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+# ASCII characters that Unicode ``\s`` matches but ASCII ``\s`` does not
+_UNICODE_ONLY_SPACES = "\x1c\x1d\x1e\x1f"
+
+
+@lru_cache(maxsize=256)
+def compiled(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Return the compiled form of *pattern*, compiling it on first use."""
+    return re.compile(pattern, flags)
+
+
+def ascii_flag(text: str) -> int:
+    """Return ``re.ASCII`` if it cannot change how the tool patterns match *text*.
+
+    ASCII ``str`` input is already stored one byte per character, so the
+    saving comes from the engine's cheaper ASCII case folding and character
+    classes, not from re-encoding. For ASCII text the two modes agree except
+    that Unicode ``\\s`` also matches the C0 separators ``\\x1c``-``\\x1f``,
+    so text containing those keeps Unicode matching.
+    """
+    if text.isascii() and not any(ch in text for ch in _UNICODE_ONLY_SPACES):
+        return re.ASCII
+    return 0
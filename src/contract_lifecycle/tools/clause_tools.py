@@ -6,175 +6,298 @@ external API calls, making them suitable for offline/demo use.
 
 from __future__ import annotations
 
+import logging
 import re
-import uuid
 from difflib import SequenceMatcher
-from typing import Any
+from functools import cache, partial
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from contract_lifecycle.models import Clause
+from contract_lifecycle.tools._regex_cache import ascii_flag, compiled
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = structlog.get_logger(__name__)
 
 # ---------------------------------------------------------------------------
 # Clause section patterns (case-insensitive, multi-line)
+#
+# Patterns are kept as (pattern, flags) sources and compiled on first use
+# through the shared cache in ``_regex_cache``.
 # ---------------------------------------------------------------------------
 
-_SECTION_PATTERNS: dict[str, re.Pattern[str]] = {
-    "TERM": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:TERM|RENEWAL|DURATION)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "PAYMENT": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:PAYMENT|COMPENSATION|FEES|PRICING)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "CONFIDENTIALITY": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:CONFIDENTIALITY|CONFIDENTIAL|NON-DISCLOSURE)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "INDEMNIFICATION": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:INDEMNIFICATION|INDEMNIFY)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "TERMINATION": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*TERMINATION[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "LIABILITY": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:LIMITATION OF LIABILITY|LIABILITY)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "IP": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:INTELLECTUAL PROPERTY|IP OWNERSHIP)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "WARRANTY": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:WARRANTY|WARRANTIES)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "GOVERNING_LAW": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:GOVERNING LAW|JURISDICTION|APPLICABLE LAW)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "FORCE_MAJEURE": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*FORCE MAJEURE[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "NON_COMPETE": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:NON-COMPETE|NON COMPETE|NONCOMPETE)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "NON_SOLICITATION": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:NON-SOLICITATION|NON SOLICITATION)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "SLA": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:SERVICE LEVEL|SLA|UPTIME)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "DATA_PROTECTION": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:DATA PROTECTION|DATA PRIVACY|GDPR)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "EQUITY": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:EQUITY|STOCK OPTION|SHARES)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "BENEFITS": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*BENEFITS[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "SCOPE": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:SCOPE OF SERVICES|SCOPE|DUTIES|POSITION)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "DEFINITION": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*(?:DEFINITION|DEFINITIONS)[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "OBLIGATIONS": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*OBLIGATIONS[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
-    "REMEDIES": re.compile(
-        r"(?:^|\n)\s*\d+\.?\s*REMEDIES[^\n]*\n(.*?)(?=\n\s*\d+\.\s+[A-Z]|\Z)",
-        re.IGNORECASE | re.DOTALL,
-    ),
+# Heading keywords per section. Order matters: when one heading matches
+# several sections (e.g. "TERMINATION" also starts with "TERM"), each
+# section keeps the first heading that matches it.
+_SECTION_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "TERM": ("TERM", "RENEWAL", "DURATION"),
+    "PAYMENT": ("PAYMENT", "COMPENSATION", "FEES", "PRICING"),
+    "CONFIDENTIALITY": ("CONFIDENTIALITY", "CONFIDENTIAL", "NON-DISCLOSURE"),
+    "INDEMNIFICATION": ("INDEMNIFICATION", "INDEMNIFY"),
+    "TERMINATION": ("TERMINATION",),
+    "LIABILITY": ("LIMITATION OF LIABILITY", "LIABILITY"),
+    "IP": ("INTELLECTUAL PROPERTY", "IP OWNERSHIP"),
+    "WARRANTY": ("WARRANTY", "WARRANTIES"),
+    "GOVERNING_LAW": ("GOVERNING LAW", "JURISDICTION", "APPLICABLE LAW"),
+    "FORCE_MAJEURE": ("FORCE MAJEURE",),
+    "NON_COMPETE": ("NON-COMPETE", "NON COMPETE", "NONCOMPETE"),
+    "NON_SOLICITATION": ("NON-SOLICITATION", "NON SOLICITATION"),
+    "SLA": ("SERVICE LEVEL", "SLA", "UPTIME"),
+    "DATA_PROTECTION": ("DATA PROTECTION", "DATA PRIVACY", "GDPR"),
+    "EQUITY": ("EQUITY", "STOCK OPTION", "SHARES"),
+    "BENEFITS": ("BENEFITS",),
+    "SCOPE": ("SCOPE OF SERVICES", "SCOPE", "DUTIES", "POSITION"),
+    "DEFINITION": ("DEFINITION", "DEFINITIONS"),
+    "OBLIGATIONS": ("OBLIGATIONS",),
+    "REMEDIES": ("REMEDIES",),
 }
 
-# Risk flag patterns applied to extracted clause text
-_RISK_FLAG_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
-    ("unlimited_liability", re.compile(r"unlimited|no limit|without limit", re.IGNORECASE)),
-    ("auto_renewal", re.compile(r"automatically renew|auto[- ]?renew", re.IGNORECASE)),
-    ("unilateral_termination", re.compile(
-        r"(?:provider|vendor|company)\s+may\s+terminate.*?without\s+cause", re.IGNORECASE
-    )),
-    ("broad_non_compete", re.compile(r"(?:worldwide|global|any market)", re.IGNORECASE)),
-    ("long_non_compete", re.compile(
-        r"(?:thirty-six|36|twenty-four|24|48|forty-eight)\s*(?:\(\d+\))?\s*months?\s*(?:following|after)",
-        re.IGNORECASE,
-    )),
-    ("one_sided_indemnification", re.compile(
-        r"(?:customer|client|employee)\s+shall\s+indemnify(?!.*?(?:each party|mutual))",
-        re.IGNORECASE,
-    )),
-    ("broad_confidentiality", re.compile(
-        r"ALL\s+information\s+(?:disclosed\s+)?(?:by\s+either\s+party\s+)?in\s+ANY\s+form",
-        re.IGNORECASE,
+# One pass over the text finds every numbered heading that starts with a
+# known keyword; ``lastgroup`` names the first section it belongs to.
+# The scan is anchored at line starts, so the engine only tries the rest of
+# the pattern where a line begins rather than at every character. Leading
+# whitespace is matched without newlines so each blank-line run is scanned
+# once rather than once per newline in it (the match then starts on the
+# last line of the run, which yields the same heading).
+_SECTION_HEADING_PATTERN: tuple[str, int] = (
+    r"^[^\S\n]*\d+\.?\s*(?:"
+    + "|".join(
+        f"(?P<{section}>{'|'.join(keywords)})"
+        for section, keywords in _SECTION_KEYWORDS.items()
+    )
+    + r")[^\n]*(?=\n)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# A section body runs until the next "N. Heading" line or end of text.
+# Stopping at the last newline of a blank-line run instead of the first
+# only adds whitespace that the caller strips.
+_SECTION_END_PATTERN: tuple[str, int] = (r"\n[^\S\n]*\d+\.\s+[A-Z]|\Z", re.IGNORECASE)
+
+
+def _overlapping_sections(section: str) -> tuple[str, ...]:
+    """Return later sections whose keywords can match the same heading.
+
+    Two keywords match at the same position only if one is a prefix of
+    the other, so only those sections need a second look.
+    """
+    names = list(_SECTION_KEYWORDS)
+    own = _SECTION_KEYWORDS[section]
+    return tuple(
+        other
+        for other in names[names.index(section) + 1 :]
+        if any(a.startswith(b) or b.startswith(a) for a in own for b in _SECTION_KEYWORDS[other])
+    )
+
+
+_OVERLAPPING_SECTIONS: dict[str, tuple[str, ...]] = {
+    section: _overlapping_sections(section) for section in _SECTION_KEYWORDS
+}
+
+# Keyword alternation per section, for re-checking an overlapping heading
+_SECTION_KEYWORD_PATTERNS: dict[str, str] = {
+    section: "|".join(keywords) for section, keywords in _SECTION_KEYWORDS.items()
+}
+
+# Risk flag patterns applied to extracted clause text (case-insensitive).
+# Sources are written in lowercase so ASCII clauses can be lowercased once
+# and matched case-sensitively (see _flag_checks).
+_RISK_FLAG_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("unlimited_liability", r"unlimited|no limit|without limit"),
+    ("auto_renewal", r"automatically renew|auto[- ]?renew"),
+    ("unilateral_termination", r"(?:provider|vendor|company)\s+may\s+terminate.*?without\s+cause"),
+    ("broad_non_compete", r"(?:worldwide|global|any market)"),
+    ("long_non_compete", (
+        r"(?:thirty-six|36|twenty-four|24|48|forty-eight)\s*+(?:\(\d+\))?\s*+months?\s*(?:following|after)"
     )),
-    ("ip_favors_provider", re.compile(
-        r"(?:owned\s+exclusively\s+by\s+(?:provider|vendor|company))",
-        re.IGNORECASE,
+    ("one_sided_indemnification", r"(?:customer|client|employee)\s+shall\s+indemnify(?!.*?(?:each party|mutual))"),
+    ("broad_confidentiality", (
+        r"all\s+information\s+(?:disclosed\s+)?(?:by\s+either\s+party\s+)?in\s+any\s+form"
     )),
-    ("high_interest_rate", re.compile(r"(?:1\.5%|2%|1\.75%)\s*per\s*month", re.IGNORECASE)),
-    ("missing_data_protection", re.compile(r"GDPR|data\s+protection|CCPA", re.IGNORECASE)),
-]
+    ("ip_favors_provider", r"(?:owned\s+exclusively\s+by\s+(?:provider|vendor|company))"),
+    ("high_interest_rate", r"(?:1\.5%|2%|1\.75%)\s*per\s*month"),
+    ("missing_data_protection", r"gdpr|data\s+protection|ccpa"),
+)
+
+# Flags whose pattern checks for a phrase later on the same line, as
+# anchor plus context: (anchor, context, whether context must be present).
+# Scanning ahead from every anchor is quadratic on long lines, so anchors
+# and contexts are located separately and the same-line test runs in
+# Python (see _context_flag).
+_CONTEXT_FLAGS: dict[str, tuple[str, str, bool]] = {
+    "unilateral_termination": (
+        r"(?:provider|vendor|company)\s+may\s+terminate",
+        r"without\s+cause",
+        True,
+    ),
+    "one_sided_indemnification": (
+        r"(?:customer|client|employee)\s+shall\s+indemnify",
+        r"each party|mutual",
+        False,
+    ),
+}
+
+# Phrases that make an otherwise unflagged clause non-standard. ASCII
+# matching keeps this equivalent to a substring test on ``text.lower()``.
+_RISKY_PHRASES: tuple[str, ...] = (
+    "unlimited",
+    "without limitation",
+    "sole discretion",
+    "irrevocable",
+    "perpetual license",
+    "worldwide",
+    "any and all claims",
+)
+_RISKY_PHRASES_PATTERN: tuple[str, int] = (
+    "|".join(re.escape(phrase) for phrase in _RISKY_PHRASES),
+    re.IGNORECASE | re.ASCII,
+)
+
+
+def _has_context_on_line(
+    text: str, anchor_ends: list[int], context_starts: list[int], required: bool
+) -> bool:
+    """Resolve a context flag from its anchor ends and context starts.
+
+    An anchor "has context" when a context phrase starts at or after the
+    anchor's end with no newline in between. Required-context flags fire
+    when any anchor has context; forbidden-context flags fire when any
+    anchor lacks it. Both lists are ascending, so one merge pass suffices.
+    """
+    line_end = -1
+    j = 0
+    for end in anchor_ends:
+        if end > line_end:
+            line_end = text.find("\n", end)
+            if line_end == -1:
+                line_end = len(text)
+        while j < len(context_starts) and context_starts[j] < end:
+            j += 1
+        has_context = j < len(context_starts) and context_starts[j] < line_end
+        if has_context == required:
+            return True
+    return False
+
+
+def _context_flag(
+    anchor: re.Pattern[str], context: re.Pattern[str], required: bool, text: str
+) -> bool:
+    """Check a :data:`_CONTEXT_FLAGS` entry against *text*."""
+    anchor_ends = [match.end() for match in anchor.finditer(text)]
+    if not anchor_ends:
+        return False
+    context_starts = [match.start() for match in context.finditer(text)]
+    return _has_context_on_line(text, anchor_ends, context_starts, required)
+
+
+@cache
+def _flag_checks(folded: bool) -> tuple[tuple[str, Callable[[str], object]], ...]:
+    """Build the per-flag checks, in declaration order.
+
+    Each check is a bound ``search`` (or a partial of :func:`_context_flag`)
+    returning a truthy value when its flag is present, so the hot loop in
+    :func:`_detect_risk_flags` makes one call per flag. Separate searches
+    beat a single fused regex here: the engine can only skip ahead on a
+    pattern's leading literals when the pattern stands alone.
+
+    *folded* checks expect lowercased ASCII text and match it
+    case-sensitively. That is equivalent to ASCII case-insensitive
+    matching, but lets the engine skip to the characters that can start a
+    match instead of trying every alternative at every position.
+    """
+    flags = re.ASCII if folded else re.IGNORECASE
+    checks: list[tuple[str, Callable[[str], object]]] = []
+    for name, pattern in _RISK_FLAG_PATTERNS:
+        if name in _CONTEXT_FLAGS:
+            anchor, context, required = _CONTEXT_FLAGS[name]
+            check: Callable[[str], object] = partial(
+                _context_flag,
+                compiled(anchor, flags),
+                compiled(context, flags),
+                required,
+            )
+        else:
+            check = compiled(pattern, flags).search
+        checks.append((name, check))
+    return tuple(checks)
+
+
+def _detect_risk_flags(clause_text: str, flags: int = 0) -> list[str]:
+    """Return the risk flags present in *clause_text*, in declaration order.
+
+    *flags* is :func:`ascii_flag` of the text; ASCII text is lowercased
+    once and checked with the folded patterns.
+    """
+    folded = bool(flags & re.ASCII)
+    text = clause_text.lower() if folded else clause_text
+    return [name for name, check in _flag_checks(folded) if check(text)]
 
 
 def extract_clauses(text: str) -> list[Clause]:
     """Extract structured clauses from raw contract text using regex.
 
-    Scans the contract text for known section headings and extracts the
-    body of each section. Applies risk-flag heuristics to each extracted
-    clause.
+    Scans the contract text once for known section headings and extracts
+    the body of the first heading for each section. Applies risk-flag
+    heuristics to each extracted clause.
 
     Args:
         text: The full contract text.
 
     Returns:
-        A list of :class:`Clause` objects with populated risk flags.
+        A list of :class:`Clause` objects with populated risk flags, in
+        document order.
     """
-    clauses: list[Clause] = []
-    seen_sections: set[str] = set()
-
-    for section_name, pattern in _SECTION_PATTERNS.items():
-        match = pattern.search(text)
-        if match and section_name not in seen_sections:
-            seen_sections.add(section_name)
-            clause_text = match.group(1).strip()
-            if not clause_text:
+    # Section -> body of the first heading matching it, in document order
+    # Clause bodies are slices of ``text``, so one check covers them all
+    ascii_only = ascii_flag(text)
+    bodies: dict[str, str] = {}
+    heading_pattern, heading_flags = _SECTION_HEADING_PATTERN
+    end_pattern, end_flags = _SECTION_END_PATTERN
+    section_end = compiled(end_pattern, end_flags | ascii_only)
+    for match in compiled(heading_pattern, heading_flags | ascii_only).finditer(text):
+        primary = match.lastgroup
+        assert primary is not None
+        keyword_start = match.start(primary)
+        body: str | None = None
+        for section_name in (primary, *_OVERLAPPING_SECTIONS[primary]):
+            if section_name in bodies:
                 continue
+            if section_name != primary and not compiled(
+                _SECTION_KEYWORD_PATTERNS[section_name], re.IGNORECASE | ascii_only
+            ).match(text, keyword_start):
+                continue
+            if body is None:
+                body_start = match.end() + 1
+                body_end = section_end.search(text, body_start)
+                body = text[body_start : body_end.start() if body_end else len(text)]
+            bodies[section_name] = body
+
+    # Checked once per call: disabled debug logging costs nothing per clause
+    log_clauses = logger.is_enabled_for(logging.DEBUG)
+    clauses: list[Clause] = []
+    for section_name, body in bodies.items():
+        clause_text = body.strip()
+        if not clause_text:
+            continue
 
-            # Detect risk flags
-            risk_flags: list[str] = []
-            for flag_name, flag_pattern in _RISK_FLAG_PATTERNS:
-                if flag_pattern.search(clause_text):
-                    risk_flags.append(flag_name)
-
-            # Determine if clause is standard (no risk flags = standard)
-            is_standard = len(risk_flags) == 0
-
-            clause = Clause(
-                id=str(uuid.uuid4())[:8],
-                title=section_name.replace("_", " ").title(),
-                text=clause_text,
-                section=section_name,
-                is_standard=is_standard,
-                risk_flags=risk_flags,
-            )
-            clauses.append(clause)
+        risk_flags = _detect_risk_flags(clause_text, ascii_only)
+
+        # Determine if clause is standard (no risk flags = standard)
+        is_standard = len(risk_flags) == 0
+
+        # ``id`` comes from Clause's default factory (a process-wide counter)
+        clause = Clause(
+            title=section_name.replace("_", " ").title(),
+            text=clause_text,
+            section=section_name,
+            is_standard=is_standard,
+            risk_flags=risk_flags,
+        )
+        clauses.append(clause)
+        if log_clauses:
             logger.debug(
                 "clause_extracted",
                 section=section_name,
@@ -199,25 +322,21 @@ def compare_versions(v1: str, v2: str) -> list[str]:
     Returns:
         Human-readable list of change descriptions.
     """
-    changes: list[str] = []
+    if v1 == v2:
+        return []
+
     lines_v1 = v1.splitlines()
     lines_v2 = v2.splitlines()
 
+    # "replace" is a delete followed by an insert; for "insert"/"delete" one
+    # of the two ranges is empty, so every non-equal opcode reduces to this.
+    changes: list[str] = []
     matcher = SequenceMatcher(None, lines_v1, lines_v2)
     for tag, i1, i2, j1, j2 in matcher.get_opcodes():
         if tag == "equal":
             continue
-        elif tag == "replace":
-            for old_line in lines_v1[i1:i2]:
-                changes.append(f"Removed: {old_line.strip()}")
-            for new_line in lines_v2[j1:j2]:
-                changes.append(f"Added: {new_line.strip()}")
-        elif tag == "insert":
-            for new_line in lines_v2[j1:j2]:
-                changes.append(f"Added: {new_line.strip()}")
-        elif tag == "delete":
-            for old_line in lines_v1[i1:i2]:
-                changes.append(f"Removed: {old_line.strip()}")
+        changes.extend(f"Removed: {line.strip()}" for line in lines_v1[i1:i2])
+        changes.extend(f"Added: {line.strip()}" for line in lines_v2[j1:j2])
 
     return changes
 
@@ -238,18 +357,4 @@ def check_standard_terms(clause: Clause) -> bool:
         return False
 
     # Additional heuristic checks
-    risky_phrases = [
-        "unlimited",
-        "without limitation",
-        "sole discretion",
-        "irrevocable",
-        "perpetual license",
-        "worldwide",
-        "any and all claims",
-    ]
-    text_lower = clause.text.lower()
-    for phrase in risky_phrases:
-        if phrase in text_lower:
-            return False
-
-    return True
+    return compiled(*_RISKY_PHRASES_PATTERN).search(clause.text) is None
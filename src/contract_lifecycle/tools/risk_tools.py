@@ -10,11 +10,9 @@ import re
 
 import structlog
 
-from contract_lifecycle.mock_data.precedents import (
-    PRECEDENT_DATABASE,
-    Precedent,
-)
+from contract_lifecycle.mock_data.precedents import lookup_precedent as _find_precedent
 from contract_lifecycle.models import RiskAssessment, RiskLevel
+from contract_lifecycle.tools._regex_cache import ascii_flag, compiled
 
 logger = structlog.get_logger(__name__)
 
@@ -26,6 +24,15 @@ _RISK_WEIGHTS: dict[RiskLevel, int] = {
     RiskLevel.CRITICAL: 4,
 }
 
+# Liability heuristics used by estimate_liability, as (pattern, flags)
+# sources for the shared compiled-pattern cache
+_DOLLAR_PATTERN: tuple[str, int] = (r"\$[\d,]+(?:\.\d{2})?", 0)
+_UNLIMITED_PATTERN: tuple[str, int] = (r"unlimited|no limit|without limit", re.IGNORECASE)
+_MULTIPLIER_PATTERN: tuple[str, int] = (
+    r"(?<!\d)(\d+)\s*(?:times|x)\s*(?:the|total|annual)",
+    re.IGNORECASE,
+)
+
 
 def calculate_risk_matrix(assessments: list[RiskAssessment]) -> RiskLevel:
     """Calculate the overall risk level from a list of clause assessments.
@@ -47,12 +54,16 @@ def calculate_risk_matrix(assessments: list[RiskAssessment]) -> RiskLevel:
     if not assessments:
         return RiskLevel.LOW
 
-    total_weight = sum(_RISK_WEIGHTS[a.risk_level] for a in assessments)
+    # One pass: tally assessments per level, then weight the tallies
+    counts = dict.fromkeys(_RISK_WEIGHTS, 0)
+    for assessment in assessments:
+        counts[assessment.risk_level] += 1
+    total_weight = sum(_RISK_WEIGHTS[level] * count for level, count in counts.items())
     avg_score = total_weight / len(assessments)
 
     # Single-clause escalation rule
-    has_critical = any(a.risk_level == RiskLevel.CRITICAL for a in assessments)
-    has_high = any(a.risk_level == RiskLevel.HIGH for a in assessments)
+    has_critical = counts[RiskLevel.CRITICAL] > 0
+    has_high = counts[RiskLevel.HIGH] > 0
 
     if has_critical:
         overall = max(RiskLevel.HIGH, _score_to_level(avg_score))
@@ -86,7 +97,8 @@ def lookup_precedent(clause_type: str) -> str | None:
     """Find the most relevant legal precedent for a clause type.
 
     Searches the mock precedent database for entries whose clause_type
-    matches (substring) the provided type.
+    matches (substring) the provided type, using the database's clause-type
+    index.
 
     Args:
         clause_type: The type of clause (e.g. ``"unlimited_liability"``).
@@ -94,14 +106,7 @@ def lookup_precedent(clause_type: str) -> str | None:
     Returns:
         A formatted precedent string, or ``None`` if no match is found.
     """
-    normalized = clause_type.lower().replace(" ", "_").replace("-", "_")
-
-    best_match: Precedent | None = None
-    for precedent in PRECEDENT_DATABASE:
-        if normalized in precedent.clause_type or precedent.clause_type in normalized:
-            best_match = precedent
-            break
-
+    best_match = _find_precedent(clause_type)
     if best_match is None:
         return None
 
@@ -124,26 +129,28 @@ def estimate_liability(clause_text: str) -> float:
     Returns:
         Estimated liability in USD. Returns 0.0 if no amounts are found.
     """
-    # Look for explicit dollar amounts
-    dollar_pattern = re.compile(r"\$[\d,]+(?:\.\d{2})?")
-    amounts = dollar_pattern.findall(clause_text)
+    ascii_only = ascii_flag(clause_text)
 
+    # Look for explicit dollar amounts
+    pattern, flags = _DOLLAR_PATTERN
     total = 0.0
-    for amount_str in amounts:
-        cleaned = amount_str.replace("$", "").replace(",", "")
+    for amount in compiled(pattern, flags | ascii_only).finditer(clause_text):
+        cleaned = amount.group().replace("$", "").replace(",", "")
         try:
             total += float(cleaned)
         except ValueError:
             continue
 
     # Check for "unlimited" liability
-    if re.search(r"unlimited|no limit|without limit", clause_text, re.IGNORECASE):
+    pattern, flags = _UNLIMITED_PATTERN
+    if compiled(pattern, flags | ascii_only).search(clause_text):
         # Flag as extremely high exposure
         total = max(total, 10_000_000.0)
         logger.warning("unlimited_liability_detected", estimated=total)
 
     # Check for multiplier language
-    multiplier_match = re.search(r"(\d+)\s*(?:times|x)\s*(?:the|total|annual)", clause_text, re.IGNORECASE)
+    pattern, flags = _MULTIPLIER_PATTERN
+    multiplier_match = compiled(pattern, flags | ascii_only).search(clause_text)
     if multiplier_match:
         multiplier = int(multiplier_match.group(1))
         if total > 0:
@@ -7,16 +7,35 @@ clauses for negotiation recommendations.
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import structlog
 
-from contract_lifecycle.mock_data.templates import CONTRACT_TEMPLATES
+from contract_lifecycle.mock_data.templates import CONTRACT_TEMPLATES, get_template
+from contract_lifecycle.tools._regex_cache import ascii_flag, compiled
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Mapping
 
 logger = structlog.get_logger(__name__)
 
+# ``{{variable_name}}`` placeholder markers in template text
+_PLACEHOLDER_PATTERN = r"\{\{(\w+)\}\}"
+
+# Returned for unknown contract types
+_NO_TEMPLATES: Mapping[str, str] = MappingProxyType({})
+
+
+@lru_cache(maxsize=128)
+def _normalize_key(name: str) -> str:
+    """Normalize a contract type or clause name to its template key."""
+    return name.lower().replace(" ", "_").replace("-", "_")
+
 
-def get_contract_template(contract_type: str) -> dict[str, str]:
+def get_contract_template(contract_type: str) -> Mapping[str, str]:
     """Retrieve the clause template set for a given contract type.
 
     Args:
@@ -24,11 +43,10 @@ def get_contract_template(contract_type: str) -> dict[str, str]:
             (e.g. ``"saas_agreement"``, ``"nda"``, ``"vendor_msa"``).
 
     Returns:
-        A dictionary mapping clause names to their standard template text.
-        Returns an empty dict for unknown contract types.
+        A read-only mapping of clause names to their standard template
+        text. Returns an empty mapping for unknown contract types.
     """
-    normalized = contract_type.lower().replace(" ", "_").replace("-", "_")
-    templates = CONTRACT_TEMPLATES.get(normalized, {})
+    templates = CONTRACT_TEMPLATES.get(_normalize_key(contract_type), _NO_TEMPLATES)
 
     if not templates:
         logger.warning("template_not_found", contract_type=contract_type)
@@ -39,14 +57,15 @@ def get_contract_template(contract_type: str) -> dict[str, str]:
             clause_count=len(templates),
         )
 
-    return dict(templates)
+    return templates
 
 
 def merge_template(template: str, variables: dict[str, str]) -> str:
     """Merge variable placeholders into a template string.
 
     Replaces ``{{variable_name}}`` patterns with corresponding values
-    from the *variables* dictionary.
+    from the *variables* dictionary in a single pass; substituted values
+    are not themselves expanded.
 
     Args:
         template: The template string with ``{{placeholder}}`` markers.
@@ -55,15 +74,22 @@ def merge_template(template: str, variables: dict[str, str]) -> str:
     Returns:
         The merged string with all recognized placeholders replaced.
     """
-    result = template
-    for key, value in variables.items():
-        placeholder = "{{" + key + "}}"
-        result = result.replace(placeholder, str(value))
+    # Most templates carry no placeholders; skip the regex pass for them
+    if "{{" not in template:
+        return template
 
-    # Warn about unreplaced placeholders
-    remaining = re.findall(r"\{\{(\w+)\}\}", result)
-    if remaining:
-        logger.warning("unresolved_placeholders", placeholders=remaining)
+    unresolved: list[str] = []
+
+    def _substitute(match: re.Match[str]) -> str:
+        name = match.group(1)
+        if name in variables:
+            return str(variables[name])
+        unresolved.append(name)
+        return match.group(0)
+
+    result = compiled(_PLACEHOLDER_PATTERN, ascii_flag(template)).sub(_substitute, template)
+    if unresolved:
+        logger.warning("unresolved_placeholders", placeholders=unresolved)
 
     return result
 
@@ -81,8 +107,7 @@ def get_standard_clauses(contract_type: str) -> list[str]:
         A list of clause name strings (e.g. ``["limitation_of_liability",
         "termination", ...]``).
     """
-    templates = get_contract_template(contract_type)
-    return list(templates.keys())
+    return list(get_contract_template(contract_type))
 
 
 def get_safe_clause_text(contract_type: str, clause_name: str) -> str | None:
@@ -97,6 +122,15 @@ def get_safe_clause_text(contract_type: str, clause_name: str) -> str | None:
     Returns:
         The safe clause text, or ``None`` if not found.
     """
-    normalized_clause = clause_name.lower().replace(" ", "_").replace("-", "_")
-    templates = get_contract_template(contract_type)
-    return templates.get(normalized_clause)
+    normalized_type = _normalize_key(contract_type)
+    normalized_clause = _normalize_key(clause_name)
+    templates = CONTRACT_TEMPLATES.get(normalized_type)
+    if not templates:
+        logger.warning("template_not_found", contract_type=contract_type)
+        return None
+    logger.debug(
+        "template_loaded",
+        contract_type=contract_type,
+        clause_count=len(templates),
+    )
+    return get_template(normalized_type, normalized_clause)
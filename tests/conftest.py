@@ -7,6 +7,16 @@ import os
 import pytest
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warmup() -> None:
+    """Import the app stack once, before the first test is timed.
+
+    FastAPI and the flow/crew/agent modules take a few hundred ms to import;
+    paying that here keeps it out of whichever test happens to run first.
+    """
+    import contract_lifecycle.api  # noqa: F401
+
+
 @pytest.fixture(autouse=True)
 def _test_env(monkeypatch: pytest.MonkeyPatch) -> None:
     """Set up test environment variables."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 SAMPLE_CONTRACT = """
@@ -52,6 +54,20 @@ either party provides 60 days written notice of non-renewal.
 """
 
 
+async def _wait_for_flow(client, session_id: str, timeout: float) -> None:
+    """Poll a session until its lifecycle flow has left intake.
+
+    The flow only writes its result back when it finishes, so this returns
+    as soon as the flow is done, or after *timeout* seconds at most.
+    """
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        resp = await client.get(f"/api/v1/contracts/{session_id}")
+        if resp.json()["state"] != "intake":
+            return
+        await asyncio.sleep(0.02)
+
+
 @pytest.mark.asyncio
 async def test_health(client):
     """Health endpoint returns service info."""
@@ -84,8 +100,7 @@ async def test_get_contract_session(client):
     )
     session_id = create_resp.json()["session_id"]
 
-    import asyncio
-    await asyncio.sleep(0.5)
+    await _wait_for_flow(client, session_id, timeout=0.5)
 
     resp = await client.get(f"/api/v1/contracts/{session_id}")
     assert resp.status_code == 200
@@ -128,8 +143,7 @@ async def test_approve_contract(client):
     )
     session_id = create_resp.json()["session_id"]
 
-    import asyncio
-    await asyncio.sleep(1.5)
+    await _wait_for_flow(client, session_id, timeout=1.5)
 
     resp = await client.post(
         f"/api/v1/contracts/{session_id}/approve",
@@ -147,8 +161,7 @@ async def test_get_report(client):
     )
     session_id = create_resp.json()["session_id"]
 
-    import asyncio
-    await asyncio.sleep(1.5)
+    await _wait_for_flow(client, session_id, timeout=1.5)
 
     resp = await client.get(f"/api/v1/contracts/{session_id}/report")
     assert resp.status_code in (200, 404)
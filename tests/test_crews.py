@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pytest
+import pytest_asyncio
 
 SAMPLE_CONTRACT = """
 NON-DISCLOSURE AGREEMENT
@@ -35,13 +36,18 @@ This Agreement is governed by the laws of New York.
 """
 
 
-@pytest.mark.asyncio
-async def test_legal_analyst():
-    """LegalAnalystAgent extracts clauses from contract text."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def sample_analysis():
+    """Analyze SAMPLE_CONTRACT once for every test in this module."""
     from contract_lifecycle.agents.legal_analyst import LegalAnalystAgent
 
-    agent = LegalAnalystAgent()
-    analysis = await agent.analyze_contract(SAMPLE_CONTRACT)
+    return await LegalAnalystAgent().analyze_contract(SAMPLE_CONTRACT)
+
+
+@pytest.mark.asyncio
+async def test_legal_analyst(sample_analysis):
+    """LegalAnalystAgent extracts clauses from contract text."""
+    analysis = sample_analysis
 
     assert analysis is not None
     assert len(analysis.clauses) > 0
@@ -49,18 +55,46 @@ async def test_legal_analyst():
     assert analysis.summary
 
 
+def test_legal_analyst_folded_patterns_match_originals():
+    """Case-folded ASCII matching finds the same spans as IGNORECASE."""
+    from contract_lifecycle.agents import legal_analyst as la
+    from contract_lifecycle.mock_data.contracts import MOCK_CONTRACTS
+
+    patterns = [
+        *(p for group in la._TYPE_PATTERNS.values() for p in group),
+        *la._PARTY_PATTERNS,
+        *la._DATE_PATTERNS,
+        *la._EXPIRATION_PATTERNS,
+        *la._VALUE_PATTERNS,
+    ]
+    for text in (SAMPLE_CONTRACT, *MOCK_CONTRACTS.values()):
+        for pattern in patterns:
+            expected = pattern.search(text)
+            folded = la._search(pattern, text, text.lower())
+            assert (folded and folded.span()) == (expected and expected.span()), pattern.pattern
+
+
 @pytest.mark.asyncio
-async def test_risk_assessor():
-    """RiskAssessorAgent identifies risks in clauses."""
+async def test_legal_analyst_non_ascii_contract(sample_analysis):
+    """Non-ASCII contracts take the unfolded path with the same results."""
     from contract_lifecycle.agents.legal_analyst import LegalAnalystAgent
+
+    analysis = await LegalAnalystAgent().analyze_contract(SAMPLE_CONTRACT + "\n© AlphaCorp\n")
+
+    assert analysis.contract_type == sample_analysis.contract_type
+    assert analysis.parties == sample_analysis.parties
+    assert analysis.effective_date == sample_analysis.effective_date
+    assert [c.title for c in analysis.clauses] == [c.title for c in sample_analysis.clauses]
+
+
+@pytest.mark.asyncio
+async def test_risk_assessor(sample_analysis):
+    """RiskAssessorAgent identifies risks in clauses."""
     from contract_lifecycle.agents.risk_assessor import RiskAssessorAgent
     from contract_lifecycle.models import ContractType
 
-    analyst = LegalAnalystAgent()
-    analysis = await analyst.analyze_contract(SAMPLE_CONTRACT)
-
     assessor = RiskAssessorAgent()
-    risks = await assessor.assess_risks(analysis.clauses, ContractType.NDA)
+    risks = await assessor.assess_risks(sample_analysis.clauses, ContractType.NDA)
 
     assert isinstance(risks, list)
     # NDA with aggressive non-compete should flag some risks
@@ -145,5 +179,131 @@ async def test_clause_extraction_tool():
 
     clauses = extract_clauses(SAMPLE_CONTRACT)
     assert len(clauses) >= 3
-    titles = [c.title.lower() for c in clauses]
-    assert any("confidential" in t for t in titles)
+    assert any("confidential" in c.title.lower() for c in clauses)
+
+
+@pytest.mark.asyncio
+async def test_approval_crew_respects_value_tiers():
+    """Approval chains change exactly at a value threshold."""
+    from contract_lifecycle.crews.approval_crew import ApprovalCrew
+    from contract_lifecycle.models import ApprovalLevel, ContractType, RiskLevel
+
+    crew = ApprovalCrew()
+
+    below = await crew.kickoff(RiskLevel.MEDIUM, 249_999.0, ContractType.CONSULTING)
+    at = await crew.kickoff(RiskLevel.MEDIUM, 250_000.0, ContractType.CONSULTING)
+    repeat = await ApprovalCrew().kickoff(RiskLevel.MEDIUM, 260_000.0, ContractType.CONSULTING)
+
+    assert ApprovalLevel.VP not in below["approval_chain"]
+    assert ApprovalLevel.VP in at["approval_chain"]
+    assert repeat["approval_chain"] == at["approval_chain"]
+
+
+def test_filter_precedents():
+    """Precedent filters combine jurisdiction, year, and risk impact."""
+    from contract_lifecycle.mock_data.precedents import filter_precedents
+
+    delaware = filter_precedents(jurisdiction="delaware", risk_impact="increases_risk")
+    assert [p.id for p in delaware] == ["PREC-001", "PREC-005"]
+    assert all(p.year >= 2024 for p in filter_precedents(min_year=2024))
+    assert filter_precedents(jurisdiction="Atlantis") == []
+
+
+@pytest.mark.asyncio
+async def test_event_stream_replay_and_history_expiry():
+    """Late subscribers replay a history snapshot; finished sessions expire."""
+    import asyncio
+
+    from contract_lifecycle.streaming import ContractEventStream
+
+    stream = ContractEventStream(history_ttl=0.01)
+    await stream.emit("s1", "intake")
+
+    seen = []
+    async for event in stream.subscribe("s1"):
+        seen.append(event.event_type)
+        if event.event_type == "intake":
+            await stream.emit("s1", "completed")
+
+    assert seen == ["intake", "completed"]
+    await asyncio.sleep(0.05)
+    assert stream.get_history("s1") == []
+
+    # Expiry ends a subscriber still waiting on a finished session
+    await stream.emit("s2", "intake")
+    await stream.emit("s2", "error")
+    replayed = [event.event_type async for event in stream.subscribe("s2")]
+    assert replayed == ["intake", "error"]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_follows_finished_session_live():
+    """Subscribers joining after ``completed`` still receive later approvals."""
+    from contract_lifecycle.streaming import ContractEventStream
+
+    stream = ContractEventStream()
+    await stream.emit("s1", "intake")
+    await stream.emit("s1", "completed")
+
+    seen = []
+    async for event in stream.subscribe("s1"):
+        seen.append(event.event_type)
+        if event.event_type == "completed":
+            await stream.emit("s1", "approved")
+        elif event.event_type == "approved":
+            stream.close("s1")
+
+    assert seen == ["intake", "completed", "approved"]
+
+
+@pytest.mark.asyncio
+async def test_event_stream_expiry_restarts_on_later_events():
+    """Events after ``completed`` keep a finished session's history alive."""
+    import asyncio
+
+    from contract_lifecycle.streaming import ContractEventStream
+
+    stream = ContractEventStream(history_ttl=0.1)
+    await stream.emit("s1", "intake")
+    await stream.emit("s1", "completed")
+    await asyncio.sleep(0.06)
+    await stream.emit("s1", "approved")
+    await asyncio.sleep(0.06)
+
+    # Past the TTL of ``completed`` but not of ``approved``
+    assert len(stream.get_history("s1")) == 3
+
+    # A late subscriber replays, then stays live until the history expires
+    replayed = [event.event_type async for event in stream.subscribe("s1")]
+    assert replayed == ["intake", "completed", "approved"]
+    assert stream.get_history("s1") == []
+
+    # An event after expiry starts a fresh history that still expires
+    await stream.emit("s1", "executed")
+    assert [e.event_type for e in stream.get_history("s1")] == ["executed"]
+    await asyncio.sleep(0.15)
+    assert stream.get_history("s1") == []
+
+
+@pytest.mark.asyncio
+async def test_ring_event_queue_drops_oldest():
+    """A full subscriber ring evicts its oldest batch; shutdown ends get()."""
+    import asyncio
+
+    from contract_lifecycle.streaming import QueueShutDown, RingEventQueue
+
+    queue = RingEventQueue(3)
+    assert [queue.put_nowait((i,)) for i in range(4)] == [False, False, False, True]
+    assert [await queue.get() for _ in range(3)] == [(1,), (2,), (3,)]
+
+    waiter = asyncio.ensure_future(queue.get())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    queue.put_nowait((4,))
+    assert await waiter == (4,)
+
+    queue.put_nowait((5,))
+    queue.shutdown()
+    assert await queue.get() == (5,)
+    with pytest.raises(QueueShutDown):
+        await queue.get()